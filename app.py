@@ -1,7 +1,7 @@
 from flask import Flask, request, jsonify, render_template
 from flask_cors import CORS
 from config import Config
-from models import db, Profile, Skill, Project, WorkExperience, Link
+from models import db, Profile, Skill, Project, WorkExperience, Link, configure_sqlite, serialized_write, sqlite_write_lock
 import json
 import os
 import logging
@@ -27,6 +27,9 @@ db.init_app(app)
 
 # Create tables when app starts with detailed error logging
 with app.app_context():
+    # Set WAL mode and other pragmas before the first connection is opened
+    configure_sqlite(app)
+    
     try:
         # Test database connection first
         db.engine.connect()
@@ -103,75 +106,80 @@ def get_profile():
         profile = Profile.query.get(profile_id)
         
         if profile is None:
-            app.logger.warning(f"Profile with ID {profile_id} not found, creating default profile")
-            # Create a default profile if none exists
-            profile = Profile(
-                name="Manomay Mali",
-                email="manomay2702@gmail.com",
-                education="M.Sc. in Computer Science, Savitribai Phule Pune University"
-            )
-            
-            try:
-                db.session.add(profile)
-                db.session.commit()
-                app.logger.info(f"Created default profile with ID: {profile.id}")
-                
-                # Add some sample skills
-                sample_skills = [
-                    Skill(profile_id=profile.id, name="C", level="advanced"),
-                    Skill(profile_id=profile.id, name="C++", level="intermediate"),
-                    Skill(profile_id=profile.id, name="Java", level="intermediate"),
-                    Skill(profile_id=profile.id, name="Python", level="advanced"),
-                    Skill(profile_id=profile.id, name="JavaScript", level="intermediate"),
-                    Skill(profile_id=profile.id, name="MySQL", level="intermediate")
-                ]
-                
-                for skill in sample_skills:
-                    db.session.add(skill)
-                
-                # Add a sample project
-                sample_project = Project(
-                    profile_id=profile.id,
-                    title="Me API Playground",
-                    description="A RESTful API for managing personal profiles",
-                    technologies=json.dumps(["Python", "Flask", "MySQL"]),
-                    github_url="https://github.com/Manomay3447/me-api-playground",
-                    demo_url="https://me-api-playground-6824.onrender.com"
-                )
-                
-                db.session.add(sample_project)
-                
-                # Add sample work experience
-                sample_work = WorkExperience(
-                    profile_id=profile.id,
-                    company="Predusk Technology Pvt. Ltd.",
-                    position="Software & AI Developer",
-                    description="Developing applications using Python",
-                    start_date=datetime.strptime('2023-01-01', '%Y-%m-%d').date(),
-                    is_current=True
-                )
-                
-                db.session.add(sample_work)
-                
-                # Add sample links
-                sample_links = [
-                    Link(profile_id=profile.id, link_type="github", url="https://github.com/Manomay3447"),
-                    Link(profile_id=profile.id, link_type="linkedin", url="https://www.linkedin.com/in/manomay-mali-35ba71251")
-                ]
-                
-                for link in sample_links:
-                    db.session.add(link)
-                
-                db.session.commit()
-                app.logger.info("Sample data created successfully")
-                
-            except Exception as db_error:
-                db.session.rollback()
-                app.logger.error(f"Error creating sample data: {db_error}")
-                return jsonify({
-                    'error': 'Database error while creating profile',
-                    'message': str(db_error)
-                }), 500
+            # Seeding is a write, so it goes through the same single-writer queue
+            with sqlite_write_lock():
+                # Another request may have seeded it while we waited
+                profile = Profile.query.get(profile_id)
+                if profile is None:
+                    app.logger.warning(f"Profile with ID {profile_id} not found, creating default profile")
+                    # Create a default profile if none exists
+                    profile = Profile(
+                        name="Manomay Mali",
+                        email="manomay2702@gmail.com",
+                        education="M.Sc. in Computer Science, Savitribai Phule Pune University"
+                    )
+
+                    try:
+                        db.session.add(profile)
+                        db.session.commit()
+                        app.logger.info(f"Created default profile with ID: {profile.id}")
+
+                        # Add some sample skills
+                        sample_skills = [
+                            Skill(profile_id=profile.id, name="C", level="advanced"),
+                            Skill(profile_id=profile.id, name="C++", level="intermediate"),
+                            Skill(profile_id=profile.id, name="Java", level="intermediate"),
+                            Skill(profile_id=profile.id, name="Python", level="advanced"),
+                            Skill(profile_id=profile.id, name="JavaScript", level="intermediate"),
+                            Skill(profile_id=profile.id, name="MySQL", level="intermediate")
+                        ]
+
+                        for skill in sample_skills:
+                            db.session.add(skill)
+
+                        # Add a sample project
+                        sample_project = Project(
+                            profile_id=profile.id,
+                            title="Me API Playground",
+                            description="A RESTful API for managing personal profiles",
+                            technologies=json.dumps(["Python", "Flask", "MySQL"]),
+                            github_url="https://github.com/Manomay3447/me-api-playground",
+                            demo_url="https://me-api-playground-6824.onrender.com"
+                        )
+
+                        db.session.add(sample_project)
+
+                        # Add sample work experience
+                        sample_work = WorkExperience(
+                            profile_id=profile.id,
+                            company="Predusk Technology Pvt. Ltd.",
+                            position="Software & AI Developer",
+                            description="Developing applications using Python",
+                            start_date=datetime.strptime('2023-01-01', '%Y-%m-%d').date(),
+                            is_current=True
+                        )
+
+                        db.session.add(sample_work)
+
+                        # Add sample links
+                        sample_links = [
+                            Link(profile_id=profile.id, link_type="github", url="https://github.com/Manomay3447"),
+                            Link(profile_id=profile.id, link_type="linkedin", url="https://www.linkedin.com/in/manomay-mali-35ba71251")
+                        ]
+
+                        for link in sample_links:
+                            db.session.add(link)
+
+                        db.session.commit()
+                        app.logger.info("Sample data created successfully")
+
+                    except Exception as db_error:
+                        db.session.rollback()
+                        app.logger.error(f"Error creating sample data: {db_error}")
+                        return jsonify({
+                            'error': 'Database error while creating profile',
+                            'message': str(db_error)
+                        }), 500
         
         # Convert profile to dictionary with error handling
         try:
@@ -259,6 +267,7 @@ def get_profile():
         }), 500
 
 @app.route('/api/profile', methods=['POST'])
+@serialized_write
 def create_profile():
     try:
         data = request.get_json()
@@ -325,6 +334,7 @@ def create_profile():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/profile/<int:profile_id>', methods=['PUT'])
+@serialized_write
 def update_profile(profile_id):
     try:
         profile = Profile.query.get_or_404(profile_id)
@@ -416,6 +426,7 @@ def search():
 
 # Debug endpoint to test profile creation
 @app.route('/debug/test-profile')
+@serialized_write
 def debug_test_profile():
     try:
         # Check if any profiles exist
@@ -0,0 +1,110 @@
+"""
+Read throughput benchmark for the SQLite fallback backend.
+
+Spawns 1, 2, 4, ... worker processes (like gunicorn workers), each hitting the
+read endpoints through the Flask test client for a fixed duration, and prints
+requests/second. Scaling only shows up on a machine with several cores;
+on a single core extra workers just compete for the CPU.
+
+Usage:
+    python benchmark_sqlite.py [--workers 8] [--duration 5]
+"""
+import argparse
+import multiprocessing
+import os
+import queue
+import time
+
+# Force the SQLite fallback before config.py is imported. Empty values (not
+# missing ones) so load_dotenv() can't bring back a MySQL URL from .env
+os.environ['DATABASE_URL'] = ''
+os.environ['MYSQL_PASSWORD'] = ''
+
+READ_PATHS = ['/api/profile', '/api/skills', '/api/projects', '/api/search?q=Python']
+
+def run_worker(duration, results):
+    from app import app
+    from models import db
+
+    # Don't reuse connections inherited from the parent process
+    with app.app_context():
+        db.engine.dispose(close=False)
+
+    client = app.test_client()
+    count = 0
+    error = None
+    try:
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            path = READ_PATHS[count % len(READ_PATHS)]
+            response = client.get(path)
+            if response.status_code != 200:
+                raise RuntimeError(f'{path} returned {response.status_code}')
+            count += 1
+    except Exception as e:
+        error = f'{type(e).__name__}: {e}'
+    finally:
+        # Always report back so the parent never blocks on results.get()
+        results.put((count, error))
+
+def run(workers, duration):
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=run_worker, args=(duration, results)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    reports = []
+    for _ in processes:
+        try:
+            reports.append(results.get(timeout=duration + 30))
+        except queue.Empty:
+            break
+
+    errors = [error for _, error in reports if error]
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():
+            # Stuck worker (e.g. blocked on a database lock) - don't wait for it forever
+            process.terminate()
+            process.join()
+            errors.append(f'worker {process.pid} hung and was terminated')
+        elif process.exitcode:
+            errors.append(f'worker {process.pid} exited with code {process.exitcode}')
+    if len(reports) < workers and not errors:
+        errors.append(f'only {len(reports)} of {workers} workers reported')
+    if errors:
+        raise RuntimeError('; '.join(errors))
+    return sum(count for count, _ in reports) / duration
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite read throughput benchmark')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4, help='maximum number of worker processes')
+    parser.add_argument('--duration', type=float, default=5.0, help='seconds per run')
+    args = parser.parse_args()
+
+    # Create tables and seed the default profile once before measuring
+    from app import app
+    # Per-request logging to stdout would dominate the numbers (workers inherit this)
+    app.logger.disabled = True
+    database_uri = app.config['SQLALCHEMY_DATABASE_URI']
+    if not database_uri.startswith('sqlite'):
+        parser.error(f'expected the SQLite fallback, got {database_uri}')
+    app.test_client().get('/api/profile')
+
+    # 1, 2, 4, ... and always the requested maximum
+    steps = []
+    workers = 1
+    while workers < args.workers:
+        steps.append(workers)
+        workers *= 2
+    steps.append(max(args.workers, 1))
+
+    baseline = None
+    print(f"{'workers':>8} {'req/s':>10} {'speedup':>8}")
+    for workers in steps:
+        throughput = run(workers, args.duration)
+        baseline = baseline or throughput
+        speedup = f'{throughput / baseline:>7.2f}x' if baseline else f"{'n/a':>8}"
+        print(f'{workers:>8} {throughput:>10.1f} {speedup}')
+
+if __name__ == '__main__':
+    main()
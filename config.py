@@ -1,5 +1,6 @@
 import os
 from dotenv import load_dotenv
+from sqlalchemy.pool import QueuePool
 
 load_dotenv()
 
@@ -34,10 +35,27 @@ class Config:
             SQLALCHEMY_DATABASE_URI = 'sqlite:///me_api_playground.db'
     
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_recycle': 300,
-        'pool_pre_ping': True,
-        'pool_timeout': 20,
-        'pool_size': 10,
-        'max_overflow': 20
-    }
+    
+    if SQLALCHEMY_DATABASE_URI.startswith('sqlite'):
+        # SQLite - QueuePool hands each connection to one thread at a time and reuses it,
+        # so it is thread-safe without paying NullPool's reconnect cost per request
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            'poolclass': QueuePool
+        }
+        # Applied on every new connection (see models.configure_sqlite)
+        SQLITE_PRAGMAS = {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', 268435456)),  # 256 MB
+            'cache_size': int(os.environ.get('SQLITE_CACHE_SIZE', -64000)),  # ~64 MB
+            'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', 30000))  # ms
+        }
+    else:
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            'pool_recycle': 300,
+            'pool_pre_ping': True,
+            'pool_timeout': 20,
+            'pool_size': 10,
+            'max_overflow': 20
+        }
+        SQLITE_PRAGMAS = {}
@@ -1,9 +1,69 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 from datetime import datetime
+from functools import wraps
+from contextlib import contextmanager
+import threading
 import json
 
+try:
+    import fcntl
+except ImportError:  # Windows - writes are only serialized within one process
+    fcntl = None
+
 db = SQLAlchemy()
 
+# SQLite allows a single writer at a time, so writes from every worker process are
+# queued on an flock()ed file next to the database instead of racing for the
+# database lock. The thread lock queues threads within a worker first.
+_sqlite_write_lock = threading.Lock()
+_sqlite_lock_path = None
+
+def configure_sqlite(app):
+    """Apply SQLITE_PRAGMAS to every new connection. No-op for non-SQLite databases."""
+    global _sqlite_lock_path
+    pragmas = app.config.get('SQLITE_PRAGMAS') or {}
+    if not pragmas or db.engine.dialect.name != 'sqlite':
+        return
+
+    database = db.engine.url.database
+    if database and database != ':memory:':
+        _sqlite_lock_path = f'{database}-write.lock'
+
+    @event.listens_for(db.engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+
+@contextmanager
+def sqlite_write_lock():
+    """Hold the single-writer queue when using SQLite. No-op for other databases."""
+    if db.engine.dialect.name != 'sqlite':
+        yield
+        return
+
+    with _sqlite_write_lock:
+        if fcntl is None or _sqlite_lock_path is None:
+            yield
+            return
+
+        with open(_sqlite_lock_path, 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def serialized_write(view):
+    """Run a write route through the single-writer queue when using SQLite."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        with sqlite_write_lock():
+            return view(*args, **kwargs)
+    return wrapper
+
 class Profile(db.Model):
     __tablename__ = 'profiles'
     
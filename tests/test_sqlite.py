@@ -0,0 +1,66 @@
+import multiprocessing
+import os
+import sys
+import time
+
+import pytest
+from flask import Flask
+
+# Select the SQLite fallback before config.py is imported. Empty values (not
+# missing ones) so load_dotenv() can't bring back a MySQL URL from .env
+os.environ['DATABASE_URL'] = ''
+os.environ['MYSQL_PASSWORD'] = ''
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from models import db, configure_sqlite, sqlite_write_lock
+
+@pytest.fixture
+def app(tmp_path):
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{tmp_path / 'test.db'}"
+    db.init_app(app)
+    with app.app_context():
+        configure_sqlite(app)
+        yield app
+        db.engine.dispose()
+
+def test_config_uses_sqlite_fallback():
+    assert Config.SQLALCHEMY_DATABASE_URI.startswith('sqlite')
+    assert 'pool_size' not in Config.SQLALCHEMY_ENGINE_OPTIONS
+
+def test_new_connection_applies_pragmas(app):
+    pragmas = Config.SQLITE_PRAGMAS
+    with db.engine.connect() as connection:
+        def pragma(name):
+            return connection.exec_driver_sql(f'PRAGMA {name}').scalar()
+
+        assert pragma('journal_mode') == 'wal'
+        assert pragma('synchronous') == 1  # NORMAL
+        assert pragma('busy_timeout') == pragmas['busy_timeout']
+        assert pragma('cache_size') == pragmas['cache_size']
+        assert pragma('mmap_size') == pragmas['mmap_size']
+
+def _hold_write_lock(app, intervals):
+    with app.app_context():
+        with sqlite_write_lock():
+            start = time.monotonic()
+            time.sleep(0.2)
+            intervals.put((start, time.monotonic()))
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='cross-process lock needs fcntl')
+def test_write_lock_serializes_across_processes(app):
+    context = multiprocessing.get_context('fork')
+    intervals = context.Queue()
+    workers = [context.Process(target=_hold_write_lock, args=(app, intervals)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    results = sorted(intervals.get(timeout=10) for _ in workers)
+    for worker in workers:
+        worker.join(timeout=5)
+        assert worker.exitcode == 0
+
+    # No two processes were inside the lock at the same time
+    for (_, previous_end), (next_start, _) in zip(results, results[1:]):
+        assert next_start >= previous_end